@@ -13,6 +13,7 @@ class UIController {
         this.r2 = 42164; // Default: GEO
         this.rb = 80000; // Default bi-elliptic intermediate
         this.results = null;
+        this.sliderDragging = false;
 
         this.initializeElements();
         this.attachEventListeners();
@@ -74,22 +75,47 @@ class UIController {
             this.calculateTransfer();
         });
 
-        // Sliders
+        // Sliders: low-resolution previews while a pointer drags them, full
+        // render on 'change'. Keyboard steps fire both 'input' and 'change',
+        // so they skip the preview and only get the full render.
+        [this.r1Slider, this.r2Slider, this.rbSlider].forEach((slider) => {
+            slider?.addEventListener('pointerdown', () => {
+                this.sliderDragging = true;
+            });
+        });
+        const endDrag = () => {
+            this.sliderDragging = false;
+        };
+        window.addEventListener('pointerup', endDrag);
+        window.addEventListener('pointercancel', endDrag);
+
         this.r1Slider?.addEventListener('input', (e) => {
             this.r1 = parseFloat(e.target.value);
             this.updateValueDisplays();
-            this.calculateTransfer();
+            if (this.sliderDragging) {
+                this.calculateTransfer({ preview: true });
+            }
         });
+        this.r1Slider?.addEventListener('change', () => this.calculateTransfer());
 
         this.r2Slider?.addEventListener('input', (e) => {
             this.r2 = parseFloat(e.target.value);
             this.updateValueDisplays();
-            this.calculateTransfer();
+            if (this.sliderDragging) {
+                this.calculateTransfer({ preview: true });
+            }
         });
+        this.r2Slider?.addEventListener('change', () => this.calculateTransfer());
 
         this.rbSlider?.addEventListener('input', (e) => {
             this.rb = parseFloat(e.target.value);
             this.updateValueDisplays();
+            if (this.sliderDragging &&
+                (this.transferType === 'bielliptic' || this.transferType === 'both')) {
+                this.calculateTransfer({ preview: true });
+            }
+        });
+        this.rbSlider?.addEventListener('change', () => {
             if (this.transferType === 'bielliptic' || this.transferType === 'both') {
                 this.calculateTransfer();
             }
@@ -174,14 +200,17 @@ class UIController {
 
     /**
      * Calculate the orbital transfer using Python
+     * @param {Object} [options]
+     * @param {boolean} [options.preview=false] - Render a reduced-resolution plot
      */
-    async calculateTransfer() {
+    async calculateTransfer({ preview = false } = {}) {
         console.log('[UIController] calculateTransfer called', {
             currentBody: this.currentBody,
             transferType: this.transferType,
             r1: this.r1,
             r2: this.r2,
             rb: this.rb,
+            preview,
             isReady: pyodideLoader.isReady,
             modulesLoaded: pyodideLoader.areModulesLoaded()
         });
@@ -204,6 +233,7 @@ class UIController {
             pyodideLoader.setGlobal('r1', this.r1);
             pyodideLoader.setGlobal('r2', this.r2);
             pyodideLoader.setGlobal('rb', this.rb);
+            pyodideLoader.setGlobal('preview', preview);
 
             // Run calculation with comprehensive error handling
             const pythonCode = `
@@ -248,7 +278,8 @@ try:
     plot_base64 = plot_transfer_comparison(
         r1_km, r2_km, rb_km, mu,
         body_radius, body.name,
-        distance_unit, transfer_type
+        distance_unit, transfer_type,
+        preview=preview
     )
 
     # Format results
@@ -0,0 +1,90 @@
+"""
+Numba-compiled RK4 integrator specialised for the two-body problem.
+Used as a fast path by numerical_integration when numba is installed
+(it is not available under Pyodide, where the pure-Python path is used).
+"""
+
+import math
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True, fastmath=True)
+def _two_body_derivs(x, y, z, vx, vy, vz, mu):
+    """Two-body derivatives on unpacked scalars: (vx, vy, vz, ax, ay, az)."""
+    r2 = x*x + y*y + z*z
+    inv_r3 = -mu / (r2 * math.sqrt(r2))
+    return vx, vy, vz, inv_r3 * x, inv_r3 * y, inv_r3 * z
+
+
+@numba.njit(cache=True, fastmath=True)
+def _rk4_two_body_step(y, t, dt, mu, out):
+    """
+    Single fused RK4 step for two-body dynamics.
+
+    Reads the state from y and writes y(t + dt) into out. All stages are
+    kept in scalars so no temporary arrays are allocated.
+    """
+    y0, y1, y2, y3, y4, y5 = y[0], y[1], y[2], y[3], y[4], y[5]
+    dt_half = 0.5 * dt
+
+    a0, a1, a2, a3, a4, a5 = _two_body_derivs(y0, y1, y2, y3, y4, y5, mu)
+    b0, b1, b2, b3, b4, b5 = _two_body_derivs(
+        y0 + dt_half*a0, y1 + dt_half*a1, y2 + dt_half*a2,
+        y3 + dt_half*a3, y4 + dt_half*a4, y5 + dt_half*a5, mu)
+    c0, c1, c2, c3, c4, c5 = _two_body_derivs(
+        y0 + dt_half*b0, y1 + dt_half*b1, y2 + dt_half*b2,
+        y3 + dt_half*b3, y4 + dt_half*b4, y5 + dt_half*b5, mu)
+    d0, d1, d2, d3, d4, d5 = _two_body_derivs(
+        y0 + dt*c0, y1 + dt*c1, y2 + dt*c2,
+        y3 + dt*c3, y4 + dt*c4, y5 + dt*c5, mu)
+
+    dt_sixth = dt / 6.0
+    out[0] = y0 + dt_sixth * (a0 + 2.0*b0 + 2.0*c0 + d0)
+    out[1] = y1 + dt_sixth * (a1 + 2.0*b1 + 2.0*c1 + d1)
+    out[2] = y2 + dt_sixth * (a2 + 2.0*b2 + 2.0*c2 + d2)
+    out[3] = y3 + dt_sixth * (a3 + 2.0*b3 + 2.0*c3 + d3)
+    out[4] = y4 + dt_sixth * (a4 + 2.0*b4 + 2.0*c4 + d4)
+    out[5] = y5 + dt_sixth * (a5 + 2.0*b5 + 2.0*c5 + d5)
+    return out
+
+
+@numba.njit(cache=True, fastmath=True)
+def _propagate_two_body_numba(y0, t0, t_end, dt, mu):
+    """
+    Fixed-step RK4 propagation of the two-body problem.
+
+    The final step is shortened to land exactly on t_end, matching
+    propagate_trajectory.
+
+    Returns:
+        (t, y) arrays of shape [N+1] and [N+1, 6]; y is column-major
+    """
+    # Same tolerant step count as numerical_integration._num_fixed_steps
+    n_steps = max(0, int(math.ceil((t_end - t0) / dt - 1e-9)))
+
+    # Component-major storage; the transpose gives a column-major [N+1, 6]
+    t_out = np.empty(n_steps + 1)
+    y_cols = np.empty((6, n_steps + 1))
+
+    t_out[0] = t0
+    for j in range(6):
+        y_cols[j, 0] = y0[j]
+
+    y = np.empty(6)
+    y_new = np.empty(6)
+    for j in range(6):
+        y[j] = y0[j]
+
+    t = t0
+    for i in range(n_steps):
+        current_dt = dt if i + 1 < n_steps else t_end - t
+        _rk4_two_body_step(y, t, current_dt, mu, y_new)
+        for j in range(6):
+            y[j] = y_new[j]
+            y_cols[j, i + 1] = y_new[j]
+        t = t0 + (i + 1) * dt if i + 1 < n_steps else t_end
+        t_out[i + 1] = t
+
+    return t_out, y_cols.T
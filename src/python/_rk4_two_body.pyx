@@ -0,0 +1,87 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# distutils: extra_compile_args = -O3 -ffast-math
+"""
+Cython RK4 integrator specialised for the two-body problem.
+Optional compiled fast path for CPython deployments without numba; the
+browser build never loads it. Build in place with:
+
+    cythonize -i src/python/_rk4_two_body.pyx
+"""
+
+from libc.math cimport ceil, sqrt
+
+import numpy as np
+
+
+cdef inline void _two_body_derivs(const double* s, double mu, double* out) noexcept nogil:
+    """Two-body derivatives [vx, vy, vz, ax, ay, az] of state s."""
+    cdef double r2 = s[0]*s[0] + s[1]*s[1] + s[2]*s[2]
+    cdef double k = -mu / (r2 * sqrt(r2))
+    out[0] = s[3]
+    out[1] = s[4]
+    out[2] = s[5]
+    out[3] = k * s[0]
+    out[4] = k * s[1]
+    out[5] = k * s[2]
+
+
+def rk4_two_body(double[::1] y0, double t0, double t_end, double dt, double mu):
+    """
+    Fixed-step RK4 propagation of the two-body problem.
+
+    The final step is shortened to land exactly on t_end, matching
+    propagate_trajectory.
+
+    Returns:
+        (t, y) arrays of shape [N+1] and [N+1, 6]; y is column-major
+    """
+    # Same tolerant step count as numerical_integration._num_fixed_steps
+    cdef Py_ssize_t n_steps = <Py_ssize_t>ceil((t_end - t0) / dt - 1e-9)
+    if n_steps < 0:
+        n_steps = 0
+
+    t_arr = np.empty(n_steps + 1)
+    y_arr = np.empty((n_steps + 1, 6), order='F')
+    cdef double[::1] t_out = t_arr
+    cdef double[::1, :] y_out = y_arr
+
+    cdef double y[6]
+    cdef double tmp[6]
+    cdef double k1[6]
+    cdef double k2[6]
+    cdef double k3[6]
+    cdef double k4[6]
+    cdef double t = t0
+    cdef double h, h_half, h_sixth
+    cdef Py_ssize_t i, j
+
+    for j in range(6):
+        y[j] = y0[j]
+        y_out[0, j] = y0[j]
+    t_out[0] = t0
+
+    with nogil:
+        for i in range(n_steps):
+            h = dt if i + 1 < n_steps else t_end - t
+            h_half = 0.5 * h
+            h_sixth = h / 6.0
+
+            _two_body_derivs(y, mu, k1)
+            for j in range(6):
+                tmp[j] = y[j] + h_half * k1[j]
+            _two_body_derivs(tmp, mu, k2)
+            for j in range(6):
+                tmp[j] = y[j] + h_half * k2[j]
+            _two_body_derivs(tmp, mu, k3)
+            for j in range(6):
+                tmp[j] = y[j] + h * k3[j]
+            _two_body_derivs(tmp, mu, k4)
+
+            for j in range(6):
+                y[j] = y[j] + h_sixth * (k1[j] + 2.0*k2[j] + 2.0*k3[j] + k4[j])
+                y_out[i + 1, j] = y[j]
+
+            t = t0 + (i + 1) * dt if i + 1 < n_steps else t_end
+            t_out[i + 1] = t
+
+    return t_arr, y_arr
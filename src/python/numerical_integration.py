@@ -3,9 +3,23 @@ Numerical integration methods for orbital propagation.
 Includes RK4 (4th-order Runge-Kutta) and adaptive step size support.
 """
 
+import inspect
+import math
+
 import numpy as np
 from orbital_mechanics import two_body_dynamics
 
+# Compiled two-body RK4 fast path: numba if installed, else the optional
+# Cython extension. Neither is available under Pyodide, which falls back
+# to pure Python.
+try:
+    from _integrators_numba import _propagate_two_body_numba as _propagate_two_body_fast
+except ImportError:
+    try:
+        from _rk4_two_body import rk4_two_body as _propagate_two_body_fast
+    except ImportError:
+        _propagate_two_body_fast = None
+
 
 def rk4_step(f, y, t, dt, *args):
     """
@@ -36,7 +50,189 @@ def rk4_step(f, y, t, dt, *args):
     return y + dt/6 * (k1 + 2*k2 + 2*k3 + k4)
 
 
-def propagate_trajectory(dynamics_func, y0, t_span, dt, mu, method='rk4'):
+class RK4Stepper:
+    """
+    Reusable 4th-order Runge-Kutta stepper.
+
+    Applies the same scheme as rk4_step, but evaluates the stage inputs and
+    the weighted sum in preallocated scratch buffers, so repeated steps do
+    not allocate intermediate arrays. Since the stage buffer is reused, f
+    must not return or keep references to the state it is passed.
+
+    f is called as f(t, y, *args, out=k) with a preallocated stage buffer
+    k; it may write the derivatives into k and return it, or ignore out
+    and return a new array.
+    """
+
+    def __init__(self, n):
+        """
+        Args:
+            n: Length of the state vector
+        """
+        self.n = n
+        self._ytmp = np.empty(n)
+        self._acc = np.empty(n)
+        self._k = np.empty((4, n))
+
+    def step(self, f, y, t, dt, *args, out=None):
+        """
+        Single RK4 step from (t, y) to t + dt.
+
+        Args:
+            f: Function dy/dt = f(t, y, *args, out=None)
+            y: Current state vector
+            t: Current time
+            dt: Time step
+            *args: Additional arguments for f
+            out: Optional array to write the new state into (may be y)
+
+        Returns:
+            New state vector at t + dt
+        """
+        if out is None:
+            out = np.empty(self.n)
+
+        ytmp = self._ytmp
+        acc = self._acc
+        k = self._k
+        dt_half = 0.5 * dt
+        dt_sixth = dt / 6.0
+
+        k1 = f(t, y, *args, out=k[0])
+        np.multiply(k1, dt_half, out=ytmp)
+        np.add(ytmp, y, out=ytmp)
+
+        k2 = f(t + dt_half, ytmp, *args, out=k[1])
+        np.multiply(k2, dt_half, out=ytmp)
+        np.add(ytmp, y, out=ytmp)
+
+        k3 = f(t + dt_half, ytmp, *args, out=k[2])
+        np.multiply(k3, dt, out=ytmp)
+        np.add(ytmp, y, out=ytmp)
+
+        k4 = f(t + dt, ytmp, *args, out=k[3])
+
+        # acc = k1 + 2*(k2 + k3) + k4
+        np.add(k2, k3, out=acc)
+        np.multiply(acc, 2.0, out=acc)
+        np.add(acc, k1, out=acc)
+        np.add(acc, k4, out=acc)
+        np.multiply(acc, dt_sixth, out=acc)
+
+        return np.add(y, acc, out=out)
+
+
+def cash_karp_step(f, y, t, dt, *args):
+    """
+    Single step of the embedded Runge-Kutta 4(5) pair of Cash and Karp.
+
+    Six stages give both a 5th-order and an embedded 4th-order solution;
+    their difference estimates the local truncation error for step size
+    control.
+
+    Args:
+        f: Function dy/dt = f(t, y, *args)
+        y: Current state vector
+        t: Current time
+        dt: Time step
+        *args: Additional arguments for f
+
+    Returns:
+        (y5, y_err): 5th-order state at t + dt and the error estimate y5 - y4
+    """
+    k1 = f(t, y, *args)
+    k2 = f(t + dt/5, y + dt*(k1/5), *args)
+    k3 = f(t + 3*dt/10, y + dt*(3*k1/40 + 9*k2/40), *args)
+    k4 = f(t + 3*dt/5, y + dt*(3*k1/10 - 9*k2/10 + 6*k3/5), *args)
+    k5 = f(t + dt, y + dt*(-11*k1/54 + 5*k2/2 - 70*k3/27 + 35*k4/27), *args)
+    k6 = f(t + 7*dt/8, y + dt*(1631*k1/55296 + 175*k2/512 + 575*k3/13824
+                               + 44275*k4/110592 + 253*k5/4096), *args)
+
+    y5 = y + dt*(37*k1/378 + 250*k3/621 + 125*k4/594 + 512*k6/1771)
+    y4 = y + dt*(2825*k1/27648 + 18575*k3/48384 + 13525*k4/55296
+                 + 277*k5/14336 + k6/4)
+
+    return y5, y5 - y4
+
+
+def _propagate_adaptive(f, y0, t_start, t_end, dt, mu, rtol, atol):
+    """
+    Adaptive-step propagation using cash_karp_step.
+
+    Steps whose scaled error exceeds 1 are rejected and retried with a
+    smaller dt; accepted steps grow dt by up to a factor of 5.
+    """
+    times = [t_start]
+    states = [np.array(y0, dtype=np.float64)]
+
+    t = t_start
+    y = states[0]
+    num_steps = 0
+
+    while t < t_end:
+        # Adjust final step to land exactly on t_end
+        current_dt = min(dt, t_end - t)
+        if t + current_dt == t:
+            raise RuntimeError(f"Step size underflow at t={t}")
+
+        y_new, y_err = cash_karp_step(f, y, t, current_dt, mu)
+        err = np.max(np.abs(y_err)) / (atol + rtol * np.max(np.abs(y_new)))
+
+        if err > 1.0:
+            dt = current_dt * max(0.1, 0.9 * err**-0.2)
+            continue
+
+        t = t + current_dt if current_dt < t_end - t else t_end
+        y = y_new
+        num_steps += 1
+
+        times.append(t)
+        states.append(y)
+
+        dt = current_dt * (min(5.0, 0.9 * err**-0.2) if err > 0.0 else 5.0)
+
+    return {
+        't': np.array(times),
+        'y': np.array(states, order='F'),
+        'num_steps': num_steps,
+    }
+
+
+def _num_fixed_steps(t_start, t_end, dt):
+    """
+    Number of fixed steps of size dt needed to cover [t_start, t_end].
+
+    A span within round-off of a whole number of steps gets no extra
+    zero-length step; the final step is absorbed up to t_end instead.
+    """
+    return max(0, int(math.ceil((t_end - t_start) / dt - 1e-9)))
+
+
+def _time_invariant_rhs(dynamics_func):
+    """
+    Adapt dynamics_func(state, mu) to the f(t, y, mu, out=None) form used
+    by the steppers.
+
+    out is forwarded only when dynamics_func accepts it (as
+    two_body_dynamics does), so RK4Stepper's stage buffers are filled in
+    place without breaking dynamics functions that lack the argument.
+    """
+    try:
+        accepts_out = 'out' in inspect.signature(dynamics_func).parameters
+    except (TypeError, ValueError):
+        accepts_out = False
+
+    if accepts_out:
+        def f(t, y, mu_param, out=None):
+            return dynamics_func(y, mu_param, out=out)
+    else:
+        def f(t, y, mu_param, out=None):
+            return dynamics_func(y, mu_param)
+    return f
+
+
+def propagate_trajectory(dynamics_func, y0, t_span, dt, mu, method='rk4',
+                         rtol=1e-9, atol=1e-9):
     """
     Propagate a trajectory using numerical integration.
 
@@ -44,52 +240,123 @@ def propagate_trajectory(dynamics_func, y0, t_span, dt, mu, method='rk4'):
         dynamics_func: Function computing dy/dt (e.g., two_body_dynamics)
         y0: Initial state vector [x, y, z, vx, vy, vz]
         t_span: (t_start, t_end) time interval
-        dt: Time step size
+        dt: Time step size (initial step size for 'rkf45')
         mu: Gravitational parameter (passed to dynamics_func)
-        method: Integration method ('rk4' supported)
+        method: Integration method ('rk4' fixed-step or 'rkf45' adaptive)
+        rtol: Relative error tolerance per step ('rkf45' only)
+        atol: Absolute error tolerance per step ('rkf45' only)
 
     Returns:
         dict with:
             - t: Time array
-            - y: State vectors at each time step
+            - y: State vectors at each time step, shape [N, 6]. Stored
+              column-major so per-component reads (e.g. y[:, 0]) are
+              contiguous.
             - num_steps: Number of integration steps
     """
     t_start, t_end = t_span
 
+    # Compiled fast path for the unperturbed two-body problem
+    if (method == 'rk4' and dynamics_func is two_body_dynamics
+            and _propagate_two_body_fast is not None):
+        # The compiled kernels index y0[0..5] without bounds checks
+        y0_arr = np.ascontiguousarray(y0, dtype=np.float64).ravel()
+        if y0_arr.size != 6:
+            raise ValueError(f"y0 must have 6 elements, got {y0_arr.size}")
+        times, states = _propagate_two_body_fast(
+            y0_arr, float(t_start), float(t_end), float(dt), float(mu))
+        return {
+            't': times,
+            'y': states,
+            'num_steps': len(times) - 1,
+        }
+
     # Wrapper for dynamics function signature
-    def f(t, y, mu_param):
-        return dynamics_func(y, mu_param)
+    f = _time_invariant_rhs(dynamics_func)
 
-    times = [t_start]
-    states = [np.array(y0)]
+    if method == 'rkf45':
+        return _propagate_adaptive(f, y0, t_start, t_end, dt, mu, rtol, atol)
 
-    t = t_start
-    y = np.array(y0)
-    num_steps = 0
+    y = np.array(y0, dtype=np.float64)
 
-    while t < t_end:
-        # Adjust final step to land exactly on t_end
-        current_dt = min(dt, t_end - t)
+    # Preallocate output; the final step is shortened to land on t_end.
+    # States are stored column-major so each component is contiguous.
+    num_steps = _num_fixed_steps(t_start, t_end, dt)
+    times = np.empty(num_steps + 1)
+    states = np.empty((num_steps + 1, y.size), dtype=np.float64, order='F')
+    times[0] = t_start
+    states[0] = y
+
+    stepper = RK4Stepper(y.size)
+
+    t = t_start
+    for i in range(1, num_steps + 1):
+        # Final step lands exactly on t_end
+        current_dt = dt if i < num_steps else t_end - t
 
         if method == 'rk4':
-            y = rk4_step(f, y, t, current_dt, mu)
+            y = stepper.step(f, y, t, current_dt, mu, out=states[i])
         else:
             raise ValueError(f"Unknown integration method: {method}")
 
-        t += current_dt
-        num_steps += 1
+        # Index-based time avoids round-off drift from repeated t += dt
+        t = t_start + i * dt if i < num_steps else t_end
 
-        times.append(t)
-        states.append(y.copy())
+        times[i] = t
 
     return {
-        't': np.array(times),
-        'y': np.array(states),
+        't': times,
+        'y': states,
         'num_steps': num_steps,
     }
 
 
-def propagate_hohmann_transfer(r1, r2, mu, dt=60.0):
+def propagate_kepler(y0, t_span, n_out, mu):
+    """
+    Propagate an unperturbed two-body orbit analytically.
+
+    Instead of time-stepping, the orbit is sampled at n_out evenly spaced
+    times by solving Kepler's equation, so the result carries no
+    integration error regardless of n_out. Only elliptical orbits are
+    supported.
+
+    Args:
+        y0: Initial state vector [x, y, z, vx, vy, vz]
+        t_span: (t_start, t_end) time interval
+        n_out: Number of output samples (including both endpoints)
+        mu: Gravitational parameter
+
+    Returns:
+        dict with the same layout as propagate_trajectory()
+    """
+    from orbital_mechanics import cartesian_to_keplerian, solve_kepler, keplerian_to_cartesian
+
+    t_start, t_end = t_span
+
+    a, e, i, Omega, omega, nu0 = cartesian_to_keplerian(y0, mu)
+    if a <= 0 or e >= 1.0:
+        raise ValueError(f"propagate_kepler requires an elliptical orbit (e={e:.4f})")
+
+    # Mean anomaly at t_start from the initial true anomaly
+    E0 = 2 * np.arctan2(np.sqrt(1 - e) * np.sin(nu0 / 2), np.sqrt(1 + e) * np.cos(nu0 / 2))
+    M0 = E0 - e * np.sin(E0)
+    n = np.sqrt(mu / a**3)
+
+    times = np.linspace(t_start, t_end, n_out)
+    E = solve_kepler(M0 + n * (times - t_start), e)
+    nu = 2 * np.arctan2(np.sqrt(1 + e) * np.sin(E / 2), np.sqrt(1 - e) * np.cos(E / 2))
+
+    # [6, N] -> column-major [N, 6], matching the numerical propagators
+    states = keplerian_to_cartesian(a, e, i, Omega, omega, nu, mu).T
+
+    return {
+        't': times,
+        'y': states,
+        'num_steps': n_out - 1,
+    }
+
+
+def propagate_hohmann_transfer(r1, r2, mu, dt=60.0, method='kepler'):
     """
     Propagate a complete Hohmann transfer from r1 to r2.
 
@@ -97,7 +364,9 @@ def propagate_hohmann_transfer(r1, r2, mu, dt=60.0):
         r1: Initial circular orbit radius
         r2: Final circular orbit radius
         mu: Gravitational parameter
-        dt: Integration time step (seconds)
+        dt: Integration time step (seconds); sets the sample spacing for 'kepler'
+        method: 'kepler' for the analytic two-body solution, or an
+            integration method accepted by propagate_trajectory()
 
     Returns:
         dict with trajectory data and transfer parameters
@@ -121,14 +390,18 @@ def propagate_hohmann_transfer(r1, r2, mu, dt=60.0):
     y0 = np.array([r1, 0.0, 0.0, 0.0, v_peri, 0.0])
 
     # Propagate for the transfer time
-    result = propagate_trajectory(
-        two_body_dynamics,
-        y0,
-        (0, tof),
-        dt,
-        mu,
-        method='rk4'
-    )
+    if method == 'kepler':
+        n_out = max(1, _num_fixed_steps(0, tof, dt)) + 1
+        result = propagate_kepler(y0, (0, tof), n_out, mu)
+    else:
+        result = propagate_trajectory(
+            two_body_dynamics,
+            y0,
+            (0, tof),
+            dt,
+            mu,
+            method=method
+        )
 
     return {
         'trajectory': result,
@@ -155,29 +428,39 @@ def propagate_with_events(dynamics_func, y0, t_span, dt, mu, events=None, max_st
     Returns:
         dict with trajectory and detected events
     """
-    def f(t, y, mu_param):
-        return dynamics_func(y, mu_param)
+    f = _time_invariant_rhs(dynamics_func)
 
-    times = [t_span[0]]
-    states = [np.array(y0)]
+    t_start, t_end = t_span
+    y = np.array(y0, dtype=np.float64)
+
+    # Preallocate output; event_log stays a list since events are sparse
+    n_total = _num_fixed_steps(t_start, t_end, dt)
+    num_steps = min(n_total, max_steps)
+    times = np.empty(num_steps + 1)
+    states = np.empty((num_steps + 1, y.size), dtype=np.float64, order='F')
+    times[0] = t_start
+    states[0] = y
     event_log = []
+    stepper = RK4Stepper(y.size)
 
-    t = t_span[0]
-    y = np.array(y0)
+    # Event values at the current state, carried over between steps so each
+    # event function is evaluated once per step
+    events = events or []
+    prev_vals = [event_func(y) for event_func, _, _ in events]
+
+    t = t_start
     step = 0
 
-    while t < t_span[1] and step < max_steps:
-        current_dt = min(dt, t_span[1] - t)
+    while step < num_steps:
+        current_dt = dt if step + 1 < n_total else t_end - t
 
-        y_new = rk4_step(f, y, t, current_dt, mu)
-        t_new = t + current_dt
+        y_new = stepper.step(f, y, t, current_dt, mu, out=states[step + 1])
+        t_new = t_start + (step + 1) * dt if step + 1 < n_total else t_end
 
         # Check for events
         if events:
-            for event_func, direction, name in events:
-                val_old = event_func(y)
-                val_new = event_func(y_new)
-
+            new_vals = [event_func(y_new) for event_func, _, _ in events]
+            for (event_func, direction, name), val_old, val_new in zip(events, prev_vals, new_vals):
                 # Check for zero crossing
                 if val_old * val_new < 0:  # Sign change
                     if direction == 0 or (direction > 0 and val_new > val_old) or (direction < 0 and val_new < val_old):
@@ -186,17 +469,17 @@ def propagate_with_events(dynamics_func, y0, t_span, dt, mu, events=None, max_st
                             'state': y_new.copy(),
                             'event': name,
                         })
+            prev_vals = new_vals
 
         t = t_new
         y = y_new
         step += 1
 
-        times.append(t)
-        states.append(y.copy())
+        times[step] = t
 
     return {
-        't': np.array(times),
-        'y': np.array(states),
+        't': times,
+        'y': states,
         'events': event_log,
         'num_steps': step,
     }
@@ -207,22 +490,22 @@ def energy_conservation_check(states, mu):
     Check energy conservation along a trajectory.
 
     Args:
-        states: Array of state vectors [N, 6]
+        states: Array of state vectors [N, 6]; column-major input (as
+            returned by the propagators) keeps each component contiguous
         mu: Gravitational parameter
 
     Returns:
         Array of specific orbital energies
     """
-    energies = []
-    for state in states:
-        r = state[:3]
-        v = state[3:]
-        r_norm = np.linalg.norm(r)
-        v_norm = np.linalg.norm(v)
-        energy = 0.5 * v_norm**2 - mu / r_norm
-        energies.append(energy)
+    states = np.asarray(states)
+    r = states[:, :3]
+    v = states[:, 3:]
+
+    # Row-wise squared norms in a single pass, without [N, 3] temporaries
+    r_norm = np.sqrt(np.einsum('ij,ij->i', r, r))
+    v_sq = np.einsum('ij,ij->i', v, v)
 
-    return np.array(energies)
+    return 0.5 * v_sq - mu / r_norm
 
 
 def circular_orbit_state(r, mu, inclination=0.0):
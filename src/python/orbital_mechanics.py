@@ -3,6 +3,9 @@ Core orbital mechanics calculations.
 Includes two-body dynamics, transfer orbits, and vis-viva equation.
 """
 
+import math
+from functools import lru_cache
+
 import numpy as np
 from constants import EARTH, SUN, AU_KM
 
@@ -13,6 +16,8 @@ def vis_viva(r, a, mu):
 
     v = sqrt(μ * (2/r - 1/a))
 
+    Scalar inputs only; the *_vec functions cover batch evaluation.
+
     Args:
         r: Current radius (distance from central body)
         a: Semi-major axis of the orbit
@@ -21,55 +26,60 @@ def vis_viva(r, a, mu):
     Returns:
         Velocity magnitude
     """
-    return np.sqrt(mu * (2.0 / r - 1.0 / a))
+    return math.sqrt(mu * (2.0 / r - 1.0 / a))
 
 
 def circular_velocity(r, mu):
     """Velocity of a circular orbit at radius r."""
-    return np.sqrt(mu / r)
+    return math.sqrt(mu / r)
 
 
 def orbital_period(a, mu):
     """Calculate orbital period using Kepler's third law."""
-    return 2 * np.pi * np.sqrt(a**3 / mu)
+    return 2 * math.pi * math.sqrt(a**3 / mu)
 
 
-def hohmann_transfer(r1, r2, mu):
-    """
-    Calculate Hohmann transfer between two circular orbits.
+# Result keys, in the order returned by the cached transfer cores
+_HOHMANN_KEYS = (
+    'dv1', 'dv2', 'dv_total', 'tof', 'a_transfer', 'e_transfer',
+    'v_periapsis', 'v_apoapsis', 'v1_circular', 'v2_circular',
+)
+_BIELLIPTIC_KEYS = (
+    'dv1', 'dv2', 'dv3', 'dv_total', 'tof', 'tof1', 'tof2',
+    'a_transfer1', 'a_transfer2', 'e_transfer1', 'e_transfer2',
+)
 
-    The Hohmann transfer is the most fuel-efficient two-impulse transfer
-    between coplanar circular orbits.
 
-    Args:
-        r1: Initial circular orbit radius
-        r2: Final circular orbit radius
-        mu: Gravitational parameter
-
-    Returns:
-        dict with:
-            - dv1: First burn magnitude (at periapsis)
-            - dv2: Second burn magnitude (at apoapsis)
-            - dv_total: Total delta-v budget
-            - tof: Time of flight (half transfer orbit period)
-            - a_transfer: Semi-major axis of transfer orbit
-            - e_transfer: Eccentricity of transfer orbit
+def _orbital_common(a, mu):
     """
+    Circular speed sqrt(μ/a) and mean motion n = sqrt(μ/a³) for an orbit
+    of semi-major axis a, from a single square root.
+    """
+    v_a = math.sqrt(mu / a)
+    return v_a, v_a / a
+
+
+@lru_cache(maxsize=256)
+def _hohmann_transfer_core(r1, r2, mu):
+    """Memoized Hohmann computation; values ordered as _HOHMANN_KEYS."""
     # Ensure r1 is the smaller radius
     if r1 > r2:
         r1, r2 = r2, r1
 
-    # Velocities in circular orbits
+    # Velocities in circular orbits, via sqrt(r2/r1) = v1/v2
     v1 = circular_velocity(r1, mu)
-    v2 = circular_velocity(r2, mu)
+    q = math.sqrt(r2 / r1)
+    v2 = v1 / q
 
     # Transfer orbit parameters
     a_transfer = (r1 + r2) / 2.0
     e_transfer = (r2 - r1) / (r2 + r1)
+    v_a, n = _orbital_common(a_transfer, mu)
 
-    # Velocities at periapsis and apoapsis of transfer orbit
-    v_periapsis = vis_viva(r1, a_transfer, mu)
-    v_apoapsis = vis_viva(r2, a_transfer, mu)
+    # Velocities at periapsis and apoapsis of transfer orbit: vis-viva at r1
+    # reduces to v_a*sqrt(r2/r1), and r1*v_periapsis = r2*v_apoapsis
+    v_periapsis = v_a * q
+    v_apoapsis = v_periapsis * r1 / r2
 
     # Delta-v calculations
     dv1 = abs(v_periapsis - v1)  # First burn at periapsis
@@ -77,43 +87,43 @@ def hohmann_transfer(r1, r2, mu):
     dv_total = dv1 + dv2
 
     # Time of flight (half period of transfer orbit)
-    tof = np.pi * np.sqrt(a_transfer**3 / mu)
-
-    return {
-        'dv1': dv1,
-        'dv2': dv2,
-        'dv_total': dv_total,
-        'tof': tof,
-        'a_transfer': a_transfer,
-        'e_transfer': e_transfer,
-        'v_periapsis': v_periapsis,
-        'v_apoapsis': v_apoapsis,
-        'v1_circular': v1,
-        'v2_circular': v2,
-    }
+    tof = math.pi / n
 
+    return (dv1, dv2, dv_total, tof, a_transfer, e_transfer,
+            v_periapsis, v_apoapsis, v1, v2)
 
-def bielliptic_transfer(r1, r2, rb, mu):
+
+def hohmann_transfer(r1, r2, mu):
     """
-    Calculate bi-elliptic transfer between two circular orbits.
+    Calculate Hohmann transfer between two circular orbits.
 
-    The bi-elliptic transfer uses three burns and can be more efficient
-    than Hohmann when r2/r1 > 11.94.
+    The Hohmann transfer is the most fuel-efficient two-impulse transfer
+    between coplanar circular orbits. Results are memoized per (r1, r2, mu),
+    so redraws with unchanged parameters are free.
 
     Args:
         r1: Initial circular orbit radius
         r2: Final circular orbit radius
-        rb: Intermediate apoapsis radius (must be > max(r1, r2))
         mu: Gravitational parameter
 
     Returns:
-        dict with delta-v values, time of flight, and orbit parameters
+        dict with:
+            - dv1: First burn magnitude (at periapsis)
+            - dv2: Second burn magnitude (at apoapsis)
+            - dv_total: Total delta-v budget
+            - tof: Time of flight (half transfer orbit period)
+            - a_transfer: Semi-major axis of transfer orbit
+            - e_transfer: Eccentricity of transfer orbit
     """
+    return dict(zip(_HOHMANN_KEYS, _hohmann_transfer_core(r1, r2, mu)))
+
+
+@lru_cache(maxsize=256)
+def _bielliptic_transfer_core(r1, r2, rb, mu):
+    """Memoized bi-elliptic computation; values ordered as _BIELLIPTIC_KEYS."""
     # Ensure r1 < r2 for consistent calculation
-    swapped = False
     if r1 > r2:
         r1, r2 = r2, r1
-        swapped = True
 
     if rb <= r2:
         raise ValueError(f"Intermediate radius rb ({rb}) must be > r2 ({r2})")
@@ -122,15 +132,17 @@ def bielliptic_transfer(r1, r2, rb, mu):
     v1 = circular_velocity(r1, mu)
     v2 = circular_velocity(r2, mu)
 
-    # First transfer orbit (r1 to rb)
+    # First transfer orbit (r1 to rb); r1*v1_peri = rb*v1_apo
     a1 = (r1 + rb) / 2.0
-    v1_peri = vis_viva(r1, a1, mu)
-    v1_apo = vis_viva(rb, a1, mu)
+    v_a1, n1 = _orbital_common(a1, mu)
+    v1_peri = v_a1 * math.sqrt(rb / r1)
+    v1_apo = v1_peri * r1 / rb
 
-    # Second transfer orbit (rb to r2)
+    # Second transfer orbit (rb to r2); r2*v2_peri = rb*v2_apo
     a2 = (r2 + rb) / 2.0
-    v2_apo = vis_viva(rb, a2, mu)
-    v2_peri = vis_viva(r2, a2, mu)
+    v_a2, n2 = _orbital_common(a2, mu)
+    v2_peri = v_a2 * math.sqrt(rb / r2)
+    v2_apo = v2_peri * r2 / rb
 
     # Delta-v calculations
     dv1 = abs(v1_peri - v1)      # First burn at r1
@@ -139,28 +151,94 @@ def bielliptic_transfer(r1, r2, rb, mu):
     dv_total = dv1 + dv2 + dv3
 
     # Time of flight (sum of half periods)
-    tof1 = np.pi * np.sqrt(a1**3 / mu)
-    tof2 = np.pi * np.sqrt(a2**3 / mu)
+    tof1 = math.pi / n1
+    tof2 = math.pi / n2
     tof = tof1 + tof2
 
-    result = {
-        'dv1': dv1,
-        'dv2': dv2,
-        'dv3': dv3,
-        'dv_total': dv_total,
-        'tof': tof,
-        'tof1': tof1,
-        'tof2': tof2,
-        'a_transfer1': a1,
-        'a_transfer2': a2,
-        'e_transfer1': (rb - r1) / (rb + r1),
-        'e_transfer2': (rb - r2) / (rb + r2),
-    }
+    return (dv1, dv2, dv3, dv_total, tof, tof1, tof2, a1, a2,
+            (rb - r1) / (rb + r1), (rb - r2) / (rb + r2))
+
+
+def bielliptic_transfer(r1, r2, rb, mu):
+    """
+    Calculate bi-elliptic transfer between two circular orbits.
+
+    The bi-elliptic transfer uses three burns and can be more efficient
+    than Hohmann when r2/r1 > 11.94. Results are memoized like
+    hohmann_transfer.
+
+    Args:
+        r1: Initial circular orbit radius
+        r2: Final circular orbit radius
+        rb: Intermediate apoapsis radius (must be > max(r1, r2))
+        mu: Gravitational parameter
 
-    return result
+    Returns:
+        dict with delta-v values, time of flight, and orbit parameters
+    """
+    return dict(zip(_BIELLIPTIC_KEYS, _bielliptic_transfer_core(r1, r2, rb, mu)))
 
 
-def two_body_dynamics(state, mu):
+def hohmann_dv_total_vec(r1, r2, mu):
+    """
+    Total Hohmann delta-v, evaluated elementwise over arrays of radii.
+
+    Closed-form equivalent of hohmann_transfer(r1, r2, mu)['dv_total']
+    for batch evaluation (e.g. sweeping r2 for comparison plots).
+
+    Args:
+        r1: Initial circular orbit radius (scalar or array)
+        r2: Final circular orbit radius (scalar or array)
+        mu: Gravitational parameter
+
+    Returns:
+        Array of total delta-v values
+    """
+    r1 = np.asarray(r1, dtype=np.float64)
+    r2 = np.asarray(r2, dtype=np.float64)
+    r_lo = np.minimum(r1, r2)
+    r_hi = np.maximum(r1, r2)
+    a = (r_lo + r_hi) / 2.0
+
+    dv1 = np.abs(np.sqrt(mu * (2.0 / r_lo - 1.0 / a)) - np.sqrt(mu / r_lo))
+    dv2 = np.abs(np.sqrt(mu / r_hi) - np.sqrt(mu * (2.0 / r_hi - 1.0 / a)))
+
+    return dv1 + dv2
+
+
+def bielliptic_dv_total_vec(r1, r2, rb, mu):
+    """
+    Total bi-elliptic delta-v, evaluated elementwise over arrays of radii.
+
+    Closed-form equivalent of bielliptic_transfer(r1, r2, rb, mu)['dv_total'].
+    Where rb does not exceed max(r1, r2) the transfer is invalid and the
+    result is NaN instead of raising.
+
+    Args:
+        r1: Initial circular orbit radius (scalar or array)
+        r2: Final circular orbit radius (scalar or array)
+        rb: Intermediate apoapsis radius (scalar or array)
+        mu: Gravitational parameter
+
+    Returns:
+        Array of total delta-v values
+    """
+    r1 = np.asarray(r1, dtype=np.float64)
+    r2 = np.asarray(r2, dtype=np.float64)
+    rb = np.asarray(rb, dtype=np.float64)
+    r_lo = np.minimum(r1, r2)
+    r_hi = np.maximum(r1, r2)
+    a1 = (r_lo + rb) / 2.0
+    a2 = (r_hi + rb) / 2.0
+
+    dv1 = np.abs(np.sqrt(mu * (2.0 / r_lo - 1.0 / a1)) - np.sqrt(mu / r_lo))
+    dv2 = np.abs(np.sqrt(mu * (2.0 / rb - 1.0 / a2)) - np.sqrt(mu * (2.0 / rb - 1.0 / a1)))
+    dv3 = np.abs(np.sqrt(mu / r_hi) - np.sqrt(mu * (2.0 / r_hi - 1.0 / a2)))
+
+    return np.where(rb > r_hi, dv1 + dv2 + dv3, np.nan)
+
+
+def two_body_dynamics(state, mu, out=None):
     """
     Compute derivatives for the two-body problem.
 
@@ -170,19 +248,29 @@ def two_body_dynamics(state, mu):
     Args:
         state: Array [x, y, z, vx, vy, vz] in km and km/s
         mu: Gravitational parameter
+        out: Optional 6-element array to write the derivatives into
 
     Returns:
         Derivatives [vx, vy, vz, ax, ay, az]
     """
-    r = state[:3]
-    v = state[3:]
+    if out is None:
+        out = np.empty(6)
+
+    x, y, z = state[0], state[1], state[2]
+    vx, vy, vz = state[3], state[4], state[5]
 
-    r_norm = np.linalg.norm(r)
+    # -μ/|r|³ from |r|² with a single sqrt
+    r2 = x*x + y*y + z*z
+    k = -mu / (r2 * math.sqrt(r2))
 
-    # Acceleration
-    a = -mu / (r_norm ** 3) * r
+    out[0] = vx
+    out[1] = vy
+    out[2] = vz
+    out[3] = k * x
+    out[4] = k * y
+    out[5] = k * z
 
-    return np.concatenate([v, a])
+    return out
 
 
 def keplerian_to_cartesian(a, e, i, Omega, omega, nu, mu):
@@ -195,40 +283,145 @@ def keplerian_to_cartesian(a, e, i, Omega, omega, nu, mu):
         i: Inclination (radians)
         Omega: Right ascension of ascending node (radians)
         omega: Argument of periapsis (radians)
-        nu: True anomaly (radians)
+        nu: True anomaly (radians); may be an array of anomalies
         mu: Gravitational parameter
 
     Returns:
-        State vector [x, y, z, vx, vy, vz]
+        State vector [x, y, z, vx, vy, vz], or an array of shape [6, N]
+        when nu is an array of N anomalies
     """
     # Position and velocity in orbital plane
     p = a * (1 - e**2)  # Semi-latus rectum
-    r = p / (1 + e * np.cos(nu))
+    cos_nu, sin_nu = np.cos(nu), np.sin(nu)
+    r = p / (1 + e * cos_nu)
+    v_p = np.sqrt(mu / p)
 
     # Position in orbital plane
-    x_orb = r * np.cos(nu)
-    y_orb = r * np.sin(nu)
+    x_orb = r * cos_nu
+    y_orb = r * sin_nu
 
     # Velocity in orbital plane
-    vx_orb = -np.sqrt(mu / p) * np.sin(nu)
-    vy_orb = np.sqrt(mu / p) * (e + np.cos(nu))
+    vx_orb = -v_p * sin_nu
+    vy_orb = v_p * (e + cos_nu)
 
-    # Rotation matrix from orbital to inertial frame
+    # Direction cosines of the orbital-to-inertial rotation, computed once.
+    # Only the first two columns are needed since the orbital-plane z
+    # components are zero.
     cos_O, sin_O = np.cos(Omega), np.sin(Omega)
     cos_w, sin_w = np.cos(omega), np.sin(omega)
     cos_i, sin_i = np.cos(i), np.sin(i)
 
-    # Transform position
-    x = (cos_O * cos_w - sin_O * sin_w * cos_i) * x_orb + (-cos_O * sin_w - sin_O * cos_w * cos_i) * y_orb
-    y = (sin_O * cos_w + cos_O * sin_w * cos_i) * x_orb + (-sin_O * sin_w + cos_O * cos_w * cos_i) * y_orb
-    z = (sin_w * sin_i) * x_orb + (cos_w * sin_i) * y_orb
+    r11 = cos_O * cos_w - sin_O * sin_w * cos_i
+    r12 = -cos_O * sin_w - sin_O * cos_w * cos_i
+    r21 = sin_O * cos_w + cos_O * sin_w * cos_i
+    r22 = -sin_O * sin_w + cos_O * cos_w * cos_i
+    r31 = sin_w * sin_i
+    r32 = cos_w * sin_i
+
+    if np.ndim(nu) == 0:
+        # Scalar: plain products beat building arrays for small matmuls
+        return np.array([
+            r11 * x_orb + r12 * y_orb,
+            r21 * x_orb + r22 * y_orb,
+            r31 * x_orb + r32 * y_orb,
+            r11 * vx_orb + r12 * vy_orb,
+            r21 * vx_orb + r22 * vy_orb,
+            r31 * vx_orb + r32 * vy_orb,
+        ])
+
+    # Batch: rotate all in-plane positions and velocities with one matmul each
+    R = np.array([[r11, r12], [r21, r22], [r31, r32]])
+    pos = R @ np.array([x_orb, y_orb])
+    vel = R @ np.array([vx_orb, vy_orb])
+
+    return np.concatenate([pos, vel])
+
+
+def cartesian_to_keplerian(state, mu):
+    """
+    Convert a Cartesian state vector to Keplerian orbital elements.
+
+    Inverse of keplerian_to_cartesian for elliptical orbits. For equatorial
+    orbits the node line is taken along the x-axis (Omega = 0), and for
+    circular orbits periapsis is placed on the node line (omega = 0), so
+    nu is then measured from the node line.
+
+    Args:
+        state: Array [x, y, z, vx, vy, vz]
+        mu: Gravitational parameter
+
+    Returns:
+        Tuple (a, e, i, Omega, omega, nu) with angles in radians
+    """
+    tol = 1e-11
+
+    r_vec = np.asarray(state[:3], dtype=np.float64)
+    v_vec = np.asarray(state[3:], dtype=np.float64)
+    r = np.linalg.norm(r_vec)
+
+    h_vec = np.cross(r_vec, v_vec)
+    h = np.linalg.norm(h_vec)
+    h_hat = h_vec / h
+
+    # Eccentricity vector (points to periapsis)
+    e_vec = (np.dot(v_vec, v_vec) - mu / r) * r_vec / mu - np.dot(r_vec, v_vec) * v_vec / mu
+    e = np.linalg.norm(e_vec)
+
+    a = 1.0 / (2.0 / r - np.dot(v_vec, v_vec) / mu)
+    i = np.arccos(np.clip(h_vec[2] / h, -1.0, 1.0))
+
+    # Node line, falling back to the x-axis for equatorial orbits
+    n_vec = np.array([-h_vec[1], h_vec[0], 0.0])
+    n = np.linalg.norm(n_vec)
+    if n > tol * h:
+        n_hat = n_vec / n
+        Omega = np.arctan2(n_hat[1], n_hat[0])
+    else:
+        n_hat = np.array([1.0, 0.0, 0.0])
+        Omega = 0.0
+
+    # Angles measured in the direction of motion, about h
+    if e > tol:
+        omega = np.arctan2(np.dot(h_hat, np.cross(n_hat, e_vec)), np.dot(n_hat, e_vec))
+        nu = np.arctan2(np.dot(h_hat, np.cross(e_vec, r_vec)), np.dot(e_vec, r_vec))
+    else:
+        e = 0.0
+        omega = 0.0
+        nu = np.arctan2(np.dot(h_hat, np.cross(n_hat, r_vec)), np.dot(n_hat, r_vec))
+
+    return a, e, i, Omega, omega, nu
+
+
+def solve_kepler(M, e, tol=1e-14, max_iter=50):
+    """
+    Solve Kepler's equation E - e*sin(E) = M for the eccentric anomaly.
+
+    Newton iteration, vectorized over M. Starting from E = M (or E = pi for
+    e >= 0.8) converges for all elliptical orbits.
+
+    Args:
+        M: Mean anomaly (radians, scalar or array)
+        e: Eccentricity (0 <= e < 1)
+        tol: Convergence tolerance on the Newton update
+        max_iter: Maximum number of Newton iterations
+
+    Returns:
+        Eccentric anomaly E, in the same 2π-revolution as M
+    """
+    M = np.asarray(M, dtype=np.float64)
+
+    # Solve on [0, 2π) and restore the revolution count afterwards
+    revs = np.floor(M / (2 * np.pi))
+    M_wrapped = M - 2 * np.pi * revs
 
-    # Transform velocity
-    vx = (cos_O * cos_w - sin_O * sin_w * cos_i) * vx_orb + (-cos_O * sin_w - sin_O * cos_w * cos_i) * vy_orb
-    vy = (sin_O * cos_w + cos_O * sin_w * cos_i) * vx_orb + (-sin_O * sin_w + cos_O * cos_w * cos_i) * vy_orb
-    vz = (sin_w * sin_i) * vx_orb + (cos_w * sin_i) * vy_orb
+    E = M_wrapped.copy() if e < 0.8 else np.full_like(M_wrapped, np.pi)
+    for _ in range(max_iter):
+        dE = (E - e * np.sin(E) - M_wrapped) / (1.0 - e * np.cos(E))
+        E -= dE
+        if np.max(np.abs(dE), initial=0.0) < tol:
+            break
 
-    return np.array([x, y, z, vx, vy, vz])
+    return E + 2 * np.pi * revs
 
 
 def calculate_transfer_trajectory(r1, r2, mu, num_points=500):
@@ -257,24 +450,25 @@ def calculate_transfer_trajectory(r1, r2, mu, num_points=500):
     # Semi-latus rectum
     p = a * (1 - e**2)
 
-    # Calculate positions
-    positions = []
-    for nu in nu_values:
-        r = p / (1 + e * np.cos(nu))
-        x = r * np.cos(nu)
-        y = r * np.sin(nu)
-        positions.append([x, y])
+    # Calculate positions for all anomalies at once
+    cos_nu = np.cos(nu_values)
+    sin_nu = np.sin(nu_values)
+    r = p / (1 + e * cos_nu)
 
-    return np.array(positions)
+    return np.column_stack((r * cos_nu, r * sin_nu))
 
 
 def specific_orbital_energy(r, v, mu):
     """Calculate specific orbital energy: ε = v²/2 - μ/r"""
-    return 0.5 * np.dot(v, v) - mu / np.linalg.norm(r)
+    # Scalar math on the 3 components avoids numpy dispatch per call
+    v_sq = v[0]*v[0] + v[1]*v[1] + v[2]*v[2]
+    r_norm = math.sqrt(r[0]*r[0] + r[1]*r[1] + r[2]*r[2])
+    return 0.5 * v_sq - mu / r_norm
 
 
 def specific_angular_momentum(state):
     """Calculate specific angular momentum vector: h = r × v"""
-    r = state[:3]
-    v = state[3:]
-    return np.cross(r, v)
+    # Unrolled 3-vector cross product; np.cross has high per-call overhead
+    rx, ry, rz = state[0], state[1], state[2]
+    vx, vy, vz = state[3], state[4], state[5]
+    return np.array([ry*vz - rz*vy, rz*vx - rx*vz, rx*vy - ry*vx])